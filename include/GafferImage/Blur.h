@@ -46,6 +46,10 @@ namespace GafferImage
 
 IE_CORE_FORWARDDECLARE( Resample )
 
+/// \todo The filtering is performed on the CPU by an internal Resample.
+/// For large images, the two separable passes would map well onto a pair
+/// of GPU kernels, but Gaffer doesn't currently have a GPU compute
+/// dependency to build them against.
 class Blur : public ImageProcessor
 {
 	public :
@@ -42,6 +42,7 @@ import Gaffer
 import GafferTest
 import GafferImage
 import GafferImageTest
+import GafferOSL
 import os
 
 class BlurTest( GafferImageTest.ImageTestCase ) :
@@ -148,7 +149,7 @@ class BlurTest( GafferImageTest.ImageTestCase ) :
 
 		expression = Gaffer.Expression()
 		blur.addChild( expression )
-		expression.setExpression( 'parent["radius"]["x"] = context[ "loop:index" ] * 0.2', "python" )
+		expression.setExpression( 'parent.radius.x = context( "loop:index", 0 ) * 0.2;', "OSL" )
 
 		loopInit = GafferImage.Constant()
 		loopInit["format"].setValue( GafferImage.Format( 5, 5, 1.000 ) )
@@ -34,6 +34,9 @@
 #
 ##########################################################################
 
+import weakref
+import threading
+
 import IECore
 
 import Gaffer
@@ -41,6 +44,31 @@ import GafferUI
 
 import GafferScene
 
+# The extensions supported by the various readers don't change once they
+# have been registered, so we compute them on first use and reuse them for
+# every subsequent path, rather than querying the registries each time.
+_extensions = None
+def _supportedExtensions() :
+
+	global _extensions
+	if _extensions is None :
+
+		# no reason to preview a single image as a 3D scene
+		imageExtensions = set( IECore.Reader.supportedExtensions( IECore.TypeId.ImageReader ) )
+
+		sceneReaderExtensions = frozenset( GafferScene.SceneReader.supportedExtensions() )
+		objectReaderExtensions = frozenset( IECore.Reader.supportedExtensions() ) - imageExtensions
+		allExtensions = ( set( [ "abc" ] ) | sceneReaderExtensions | objectReaderExtensions ) - imageExtensions
+
+		_extensions = ( sceneReaderExtensions, objectReaderExtensions, frozenset( allExtensions ) )
+
+	return _extensions
+
+def _extension( fileName ) :
+
+	# Equivalent to `fileName.split( "." )[-1]`, without building a list.
+	return fileName[fileName.rfind( "." ) + 1:]
+
 class SceneReaderPathPreview( GafferUI.PathPreviewWidget ) :
 
 	def __init__( self, path ) :
@@ -79,28 +107,8 @@ class SceneReaderPathPreview( GafferUI.PathPreviewWidget ) :
 
 	def isValid( self ) :
 
-		path = self.getPath()
-		if not isinstance( path, ( Gaffer.FileSystemPath, Gaffer.SequencePath ) ) or not path.isLeaf() :
-			return False
-
-		if isinstance( path, Gaffer.SequencePath ) :
-
-			try :
-				sequence = IECore.FileSequence( str(path) )
-				ext = sequence.fileName.split( "." )[-1]
-			except :
-				return False
-
-		else :
-			ext = str(path).split( "." )[-1]
-
-		supported = set( [ "abc" ] )
-		supported.update( GafferScene.SceneReader.supportedExtensions() )
-		supported.update( IECore.Reader.supportedExtensions() )
-		# no reason to preview a single image as a 3D scene
-		supported.difference_update( IECore.Reader.supportedExtensions( IECore.TypeId.ImageReader ) )
-
-		return ext in supported
+		fileName, ext, sequence = self.__fileNameAndExtension()
+		return self.__isValidExtension( ext )
 
 	def _updateFromPath( self ) :
 
@@ -108,21 +116,13 @@ class SceneReaderPathPreview( GafferUI.PathPreviewWidget ) :
 		self.__script["AlembicSource"]["fileName"].setValue( "" )
 		self.__script["ObjectPreview"]["fileName"].setValue( "" )
 
-		if not self.isValid() :
+		fileName, ext, sequence = self.__fileNameAndExtension()
+		if not self.__isValidExtension( ext ) :
 			self.__script.selection().clear()
 			return
 
-		path = self.getPath()
-
-		if isinstance( path, Gaffer.SequencePath ) :
-
-			try :
-				sequence = IECore.FileSequence( str(path) )
-			except :
-				return
+		if sequence is not None :
 
-			fileName = str(sequence)
-			ext = sequence.fileName.split( "." )[-1]
 			calc = IECore.OversamplesCalculator()
 			if isinstance( sequence.frameList, IECore.FrameRange ) and sequence.frameList.step == 1 :
 				calc.setTicksPerSecond( 24 )
@@ -132,26 +132,29 @@ class SceneReaderPathPreview( GafferUI.PathPreviewWidget ) :
 			endFrame = int( calc.ticksToFrames( max(frames) ) )
 
 		else :
-			fileName = str(path)
-			ext = str(path).split( "." )[-1]
 			startFrame = None
 			endFrame = None
 
+		sceneReaderExtensions, objectReaderExtensions = _supportedExtensions()[:2]
+
 		outPlug = None
 
-		if ext in GafferScene.SceneReader.supportedExtensions() :
+		if ext in sceneReaderExtensions :
 
 			self.__script["SceneReader"]["fileName"].setValue( fileName )
 			outPlug = self.__script["SceneReader"]["out"]
 
-			scene = IECore.SharedSceneInterfaces.get( fileName )
-			if hasattr( scene, "numBoundSamples" ) :
-				numSamples = scene.numBoundSamples()
-				if numSamples > 1 :
-					startFrame = int( round( scene.boundSampleTime( 0 ) * 24.0 ) )
-					endFrame = int( round( scene.boundSampleTime( numSamples - 1 ) * 24.0 ) )
+			# Determining the frame range requires opening the file, which can
+			# be slow for large scenes, so we do it on a background thread and
+			# update the timeline when it completes. As elsewhere, we only give
+			# the thread a weak reference, so that we can die while it runs.
+			thread = threading.Thread(
+				target = IECore.curry( SceneReaderPathPreview.__loadFrameRange, weakref.ref( self ), fileName )
+			)
+			thread.daemon = True
+			thread.start()
 
-		elif ext in IECore.Reader.supportedExtensions() :
+		elif ext in objectReaderExtensions :
 
 			self.__script["ObjectPreview"]["fileName"].setValue( fileName )
 			outPlug = self.__script["ObjectPreview"]["out"]
@@ -166,16 +169,84 @@ class SceneReaderPathPreview( GafferUI.PathPreviewWidget ) :
 
 		# update the timeline
 		if startFrame is not None and endFrame is not None :
-			self.__script.context().setFrame( startFrame )
-			self.__script["frameRange"]["start"].setValue( startFrame )
-			self.__script["frameRange"]["end"].setValue( endFrame )
-			GafferUI.Playback.acquire( self.__script.context() ).setFrameRange( startFrame, endFrame )
+			self.__setFrameRange( startFrame, endFrame )
 
 		# focus the viewer
 		self.__script.selection().add( self.__script["camera"] )
+		self.__frameViewer()
+
+	def __frameViewer( self ) :
+
 		with self.__script.context() :
 			self.__viewer.viewGadgetWidget().getViewportGadget().frame( self.__script["OpenGLAttributes"]["out"].bound( "/" ) )
 
+	def __setFrameRange( self, startFrame, endFrame ) :
+
+		self.__script.context().setFrame( startFrame )
+		self.__script["frameRange"]["start"].setValue( startFrame )
+		self.__script["frameRange"]["end"].setValue( endFrame )
+		GafferUI.Playback.acquire( self.__script.context() ).setFrameRange( startFrame, endFrame )
+
+	@staticmethod
+	def __loadFrameRange( selfWeakRef, fileName ) :
+
+		scene = IECore.SharedSceneInterfaces.get( fileName )
+		if not hasattr( scene, "numBoundSamples" ) :
+			return
+
+		numSamples = scene.numBoundSamples()
+		if numSamples <= 1 :
+			return
+
+		startFrame = int( round( scene.boundSampleTime( 0 ) * 24.0 ) )
+		endFrame = int( round( scene.boundSampleTime( numSamples - 1 ) * 24.0 ) )
+
+		GafferUI.EventLoop.executeOnUIThread(
+			IECore.curry( SceneReaderPathPreview.__applyFrameRange, selfWeakRef, fileName, startFrame, endFrame )
+		)
+
+	@staticmethod
+	def __applyFrameRange( selfWeakRef, fileName, startFrame, endFrame ) :
+
+		self = selfWeakRef()
+		if self is None :
+			return
+
+		# The user may have moved on to another path while
+		# we were loading, in which case the result is stale.
+		if self.__script["SceneReader"]["fileName"].getValue() != fileName :
+			return
+
+		self.__setFrameRange( startFrame, endFrame )
+		# The bound may differ at the new start frame.
+		self.__frameViewer()
+
+	# Returns the file name and extension for the current path, along with
+	# the FileSequence for a SequencePath. The path is only converted to a
+	# string once, since that is relatively expensive. Returns Nones if the
+	# path isn't a file or sequence that could be previewed.
+	def __fileNameAndExtension( self ) :
+
+		path = self.getPath()
+		if not isinstance( path, ( Gaffer.FileSystemPath, Gaffer.SequencePath ) ) or not path.isLeaf() :
+			return None, None, None
+
+		if isinstance( path, Gaffer.SequencePath ) :
+
+			try :
+				sequence = IECore.FileSequence( str(path) )
+			except :
+				return None, None, None
+
+			return str(sequence), _extension( sequence.fileName ), sequence
+
+		fileName = str(path)
+		return fileName, _extension( fileName ), None
+
+	def __isValidExtension( self, ext ) :
+
+		return ext is not None and ext in _supportedExtensions()[2]
+
 GafferUI.PathPreviewWidget.registerType( "Scene", SceneReaderPathPreview )
 
 class _Camera( Gaffer.Node ) :
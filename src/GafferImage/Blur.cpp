@@ -68,6 +68,8 @@ Blur::Blur( const std::string &name )
 
 	addChild( resample );
 
+	// The smooth gaussian is separable, so the Resample filters in two
+	// 1D passes (horizontal then vertical) rather than a single 2D pass.
 	resample->inPlug()->setInput( inPlug() );
 	resample->filterPlug()->setValue( g_blurFilterName );
 	resample->boundingModePlug()->setInput( boundingModePlug() );